@@ -85,11 +85,37 @@ DATABASES = {
         'NAME': os.environ.get("DB_NAME"),
         'HOST': os.environ.get("DB_HOST"),
         'USER': os.environ.get("DB_USER"),
-        'PASSWORD': os.environ.get("DB_PASS")
+        'PASSWORD': os.environ.get("DB_PASS"),
+        'CONN_MAX_AGE': int(os.environ.get("DB_CONN_MAX_AGE", 0))
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+# Shared by every worker so cached auth tokens are invalidated everywhere.
+# Without CACHE_LOCATION each process keeps its own local memory cache.
+# ignore_exc turns memcached errors into cache misses, so an unreachable
+# server falls back to the database instead of failing requests.
+
+if os.environ.get("CACHE_LOCATION"):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+            'LOCATION': os.environ.get("CACHE_LOCATION"),
+            'OPTIONS': {
+                'ignore_exc': True,
+            }
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -0,0 +1,66 @@
+"""
+Django settings used when running the test suite.
+
+Inherits everything from the project settings and only overrides what
+the test suite needs.
+"""
+from .settings import *  # noqa
+
+
+# Database
+# Keep the test database in memory to avoid disk I/O on every transaction.
+# Each xdist worker is its own process, so every worker gets its own copy.
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+
+# Cache
+# Each test process keeps its own cache, so workers cannot see each other's
+# cached tokens and no memcached server is needed.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+
+# Password hashing
+# PBKDF2 dominates the cost of create_user(); MD5 is plenty for tests.
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+
+# Migrations
+# Build the test schema straight from the models instead of replaying the
+# migration history of every app.
+
+class DisableMigrations:
+    """Report every app as having no migrations module."""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
+
+
+# N+1 detection
+# Fail any request that lazily loads a relation row by row, or eager loads
+# one it never uses.
+
+INSTALLED_APPS = INSTALLED_APPS + ['nplusone.ext.django']  # noqa
+
+MIDDLEWARE = ['nplusone.ext.django.NPlusOneMiddleware'] + MIDDLEWARE  # noqa
+
+NPLUSONE_RAISE = True
@@ -0,0 +1,13 @@
+"""
+Pytest configuration for the test suite.
+"""
+from collections import Counter
+
+
+def pytest_collection_modifyitems(items):
+    """Schedule test classes marked slow first, largest class first."""
+    sizes = Counter(item.nodeid.rsplit('::', 1)[0] for item in items)
+    items.sort(key=lambda item: (
+        item.get_closest_marker('slow') is None,
+        -sizes[item.nodeid.rsplit('::', 1)[0]],
+    ))
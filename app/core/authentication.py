@@ -0,0 +1,52 @@
+"""
+Authentication classes shared by the APIs.
+"""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import router
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+TOKEN_CACHE_TIMEOUT = 60
+TOKEN_CACHE_FIELDS = ('id', 'is_active', 'is_superuser')
+
+
+def get_token_cache_key(key):
+    """Return the cache key an auth token is stored under."""
+    return f'auth-token:{key}'
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Token authentication that caches tokens to skip the database.
+
+    Only the user's TOKEN_CACHE_FIELDS are cached, never the password hash.
+    On a cache hit the other fields are deferred and load on first access,
+    so use it only on views that read request.user, not ones that save it.
+
+    Deleting a token or saving its user drops it from the cache through
+    the handlers in core.signals. Changes that bypass signals, such as
+    QuerySet.update(), show up once TOKEN_CACHE_TIMEOUT expires.
+    """
+
+    def authenticate_credentials(self, key):
+        """Return the token's user, from the cache when possible."""
+        cache_key = get_token_cache_key(key)
+        fields = cache.get(cache_key)
+        if fields is None:
+            user, token = super().authenticate_credentials(key)
+            fields = {name: getattr(user, name) for name in TOKEN_CACHE_FIELDS}
+            cache.set(cache_key, fields, TOKEN_CACHE_TIMEOUT)
+            return user, token
+
+        User = get_user_model()
+        # from_db() expects values in the model's concrete field order.
+        values = [
+            fields[field.attname] for field in User._meta.concrete_fields
+            if field.attname in fields
+        ]
+        user = User.from_db(router.db_for_read(User), list(fields), values)
+        token = Token.from_db(
+            router.db_for_read(Token), ['key', 'user_id'], [key, user.pk]
+        )
+        token.user = user
+        return user, token
@@ -54,6 +54,11 @@ class Recipe(models.Model):
     tags = models.ManyToManyField('Tag')
     ingredients = models.ManyToManyField('Ingredient')
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-id']),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -64,6 +69,11 @@ class Tag(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL,
                              on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-name']),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -74,5 +84,10 @@ class Ingredient(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL,
                              on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-name']),
+        ]
+
     def __str__(self):
         return self.name
@@ -0,0 +1,25 @@
+"""
+Signal handlers keeping cached auth tokens in sync with the database.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from core.authentication import get_token_cache_key
+
+
+@receiver(post_delete, sender=Token)
+def forget_deleted_token(sender, instance, **kwargs):
+    """Drop a deleted token from the cache."""
+    cache.delete(get_token_cache_key(instance.key))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def forget_updated_user_tokens(sender, instance, created, **kwargs):
+    """Drop the tokens of an updated user so the new state is loaded."""
+    if created:
+        return
+    keys = Token.objects.filter(user=instance).values_list('key', flat=True)
+    cache.delete_many([get_token_cache_key(key) for key in keys])
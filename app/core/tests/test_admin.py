@@ -1,12 +1,14 @@
 """
 Tests for admin page modification.
 """
+import pytest
 from django.test import TestCase
 from django.test import Client
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
 
+@pytest.mark.slow
 class AdminSiteTests(TestCase):
     """Test for django admin"""
 
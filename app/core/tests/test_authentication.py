@@ -0,0 +1,97 @@
+"""
+Tests for the cached token authentication.
+"""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+
+from core.authentication import (CachedTokenAuthentication,
+                                 get_token_cache_key)
+
+UNREACHABLE_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+        'LOCATION': '127.0.0.1:1',
+        'OPTIONS': {
+            'ignore_exc': True,
+        }
+    }
+}
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    """Test authenticating with cached tokens."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the user shared by every test in the class."""
+        cls.user = get_user_model().objects.create_user(
+            email='tokenuser@gmail.com',
+            password='tokenuser@123'
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.token = Token.objects.create(user=self.user)
+        self.auth = CachedTokenAuthentication()
+
+    def test_authenticate_returns_token_user(self):
+        """Test authenticating returns the user the token belongs to."""
+        user, token = self.auth.authenticate_credentials(self.token.key)
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(token, self.token)
+
+    def test_cached_token_skips_database(self):
+        """Test a cached token is authenticated without any query."""
+        self.auth.authenticate_credentials(self.token.key)
+
+        with self.assertNumQueries(0):
+            user, token = self.auth.authenticate_credentials(self.token.key)
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(token, self.token)
+        self.assertFalse(user.is_superuser)
+
+    def test_cache_holds_no_password(self):
+        """Test only the fields the views need are cached."""
+        self.auth.authenticate_credentials(self.token.key)
+
+        cached = cache.get(get_token_cache_key(self.token.key))
+
+        self.assertEqual(cached, {
+            'id': self.user.id,
+            'is_active': True,
+            'is_superuser': False,
+        })
+
+    def test_deleted_token_is_rejected(self):
+        """Test a deleted token is dropped from the cache."""
+        self.auth.authenticate_credentials(self.token.key)
+        self.token.delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
+
+    def test_deactivated_user_is_rejected(self):
+        """Test updating a user refreshes their cached token."""
+        self.auth.authenticate_credentials(self.token.key)
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
+
+    @override_settings(CACHES=UNREACHABLE_CACHES)
+    def test_unreachable_cache_falls_back_to_database(self):
+        """Test tokens are authenticated when the cache server is down."""
+        user, token = self.auth.authenticate_credentials(self.token.key)
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(token, self.token)
+
+        self.token.delete()
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
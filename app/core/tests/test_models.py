@@ -6,6 +6,8 @@ from django.test import TestCase
 from core import models
 from decimal import Decimal
 
+User = get_user_model()
+
 
 class ModelTests(TestCase):
     """Test model"""
@@ -14,7 +16,7 @@ class ModelTests(TestCase):
         """Test for creating user with email successful"""
         email = 'test@example.com'
         password = 'example@123'
-        user = get_user_model().objects.create_user(
+        user = User.objects.create_user(
             email=email,
             password=password
         )
@@ -29,26 +31,28 @@ class ModelTests(TestCase):
             ("TEST3@example.com", "TEST3@example.com")
         )
         for email, expected_email in sample_emails:
-            user = get_user_model().objects.\
-                create_user(email=email, password='test@123')
-            self.assertEqual(user.email, expected_email)
+            with self.subTest(email=email):
+                user = User.objects.create_user(email=email,
+                                                password='test@123')
+                self.assertEqual(user.email, expected_email)
 
     def test_new_user_without_email_raise_error(self):
         """Test the new user creation without the email"""
         with self.assertRaises(ValueError):
-            get_user_model().objects.\
-                create_user(email='', password='test@123')
+            User.objects.create_user(email='', password='test@123')
 
     def test_create_superuser(self):
         """Test create superuser"""
-        user = get_user_model().objects.\
-            create_superuser(email='test@gmail.com', password='test@123')
+        user = User.objects.create_superuser(
+            email='test@gmail.com',
+            password='test@123'
+        )
         self.assertTrue(user.is_staff)
         self.assertTrue(user.is_superuser)
 
     def test_create_recipe(self):
         """Test create recipe"""
-        user = get_user_model().objects.create_user(
+        user = User.objects.create_user(
             email='testuser1@gmail.com',
             name='Test user',
             password='testpass123'
@@ -67,7 +71,7 @@ class ModelTests(TestCase):
 
     def test_create_tag(self):
         """Test tag created success"""
-        user = get_user_model().objects.create_user(
+        user = User.objects.create_user(
             email='testuser2@gmail.com',
             name='Test user',
             password='testpass123'
@@ -81,7 +85,7 @@ class ModelTests(TestCase):
 
     def test_create_ingredients(self):
         """Test for creating ingredients is successful."""
-        user = get_user_model().objects.create_user(
+        user = User.objects.create_user(
             email='demodemo@gmail.com',
             password='demodemo@123'
         )
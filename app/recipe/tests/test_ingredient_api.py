@@ -1,7 +1,7 @@
 """
 Tests for ingredients API.
 """
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework import status
@@ -9,12 +9,16 @@ from rest_framework.test import APIClient
 from core.models import Ingredient
 from recipe.serializers import IngredientSerializer
 
+User = get_user_model()
+
 INGREDIENTS_URL = reverse('recipe:ingredient-list')
+INGREDIENT_DETAIL_PREFIX = reverse('recipe:ingredient-detail',
+                                   args=[0]).rsplit('0/', 1)[0]
 
 
 def get_detail_url(ingredient_id):
     """Create and return ingredient detail url."""
-    return reverse('recipe:ingredient-detail', args=[ingredient_id])
+    return f'{INGREDIENT_DETAIL_PREFIX}{ingredient_id}/'
 
 
 def create_ingredient(user, name):
@@ -22,11 +26,19 @@ def create_ingredient(user, name):
     return Ingredient.objects.create(user=user, name=name)
 
 
-class PublicIngredientApiTests(TestCase):
-    """Test unauthenticated API requests."""
+def create_ingredients(user, names):
+    """Create an ingredient for each name with a single query.
 
-    def setUp(self) -> None:
-        self.client = APIClient()
+    Nothing is returned: bulk_create() does not set primary keys on SQLite.
+    """
+    Ingredient.objects.bulk_create(
+        [Ingredient(user=user, name=name) for name in names]
+    )
+
+
+class PublicIngredientApiTests(SimpleTestCase):
+    """Test unauthenticated API requests."""
+    client_class = APIClient
 
     def test_auth_required(self):
         """Test auth is required for retrieving ingredients."""
@@ -37,23 +49,25 @@ class PublicIngredientApiTests(TestCase):
 
 class PrivateIngredientApiTests(TestCase):
     """Test authenticated API requests."""
+    client_class = APIClient
 
-    def setUp(self) -> None:
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create the user shared by every test in the class."""
+        cls.user = User.objects.create_user(
             email='ingredientuser@gmail.com',
             password='ingredient@123'
         )
-        self.client = APIClient()
+
+    def setUp(self) -> None:
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_ingredients(self):
         """Test for retrieving a list of ingredients."""
-        create_ingredient(user=self.user,
-                          name='Lasun')
-        create_ingredient(user=self.user,
-                          name='Coriander')
+        create_ingredients(user=self.user, names=['Lasun', 'Coriander'])
 
-        res = self.client.get(INGREDIENTS_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(INGREDIENTS_URL)
 
         ingredients = Ingredient.objects.all().order_by('-name')
         serialize = IngredientSerializer(ingredients, many=True)
@@ -63,7 +77,7 @@ class PrivateIngredientApiTests(TestCase):
 
     def test_ingredients_limited_to_user(self):
         """Test list of ingredients limited to authenticated user."""
-        other_user = get_user_model().objects.create_user(
+        other_user = User.objects.create_user(
             email='otheruser@gmail.com',
             password='otheruser@123'
         )
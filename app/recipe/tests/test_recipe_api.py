@@ -1,43 +1,57 @@
 """
 Test recipe api
 """
-from django.test import TestCase
+import pytest
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.authtoken.models import Token
 from core.models import Recipe, Tag, Ingredient
 from decimal import Decimal
 from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
 
+User = get_user_model()
+
 RECIPES_URL = reverse('recipe:recipe-list')
+RECIPE_DETAIL_PREFIX = reverse('recipe:recipe-detail',
+                               args=[0]).rsplit('0/', 1)[0]
+
+RECIPE_DEFAULTS = {
+    'title': 'Sample recipe',
+    'time_minutes': 5,
+    'price': Decimal('15.40'),
+    'description': 'Sample description',
+    'link': 'demo link'
+}
 
 
 def get_detail_url(recipe_id):
     """Create and return a recipe detail url."""
-    return reverse('recipe:recipe-detail', args=[recipe_id])
+    return f'{RECIPE_DETAIL_PREFIX}{recipe_id}/'
 
 
 def create_recipe(user, **params):
     """Create recipe"""
-    defaults = {
-        'title': 'Sample recipe',
-        'time_minutes': 5,
-        'price': Decimal('15.40'),
-        'description': 'Sample description',
-        'link': 'demo link'
-    }
-    defaults.update(**params)
+    return Recipe.objects.create(user=user, **{**RECIPE_DEFAULTS, **params})
 
-    recipe = Recipe.objects.create(user=user, **defaults)
-    return recipe
 
+def create_recipes(user, n, **params):
+    """Create n recipes with a single query.
 
-class PublicRecipeApiTest(TestCase):
-    """Test for unauthenticated API requests"""
+    Nothing is returned: bulk_create() does not set primary keys on SQLite.
+    """
+    fields = {**RECIPE_DEFAULTS, **params}
+    Recipe.objects.bulk_create(
+        [Recipe(user=user, **fields) for _ in range(n)]
+    )
 
-    def setUp(self):
-        self.client = APIClient()
+
+class PublicRecipeApiTest(SimpleTestCase):
+    """Test for unauthenticated API requests"""
+    client_class = APIClient
 
     def test_auth_required(self):
         """Test auth is required to call the API"""
@@ -46,38 +60,57 @@ class PublicRecipeApiTest(TestCase):
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@pytest.mark.slow
 class PrivateRecipeApiTest(TestCase):
     """Test for authenticated user"""
+    client_class = APIClient
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create the users shared by every test in the class."""
+        cls.user = User.objects.create_user(
             email='testme@test.com',
             password='testpass123'
         )
+        cls.other_user = User.objects.create_user(
+            email='myemailtest@gmail.com',
+            password='ohmydemo123'
+        )
 
+    def setUp(self):
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_recipe(self):
         """Test for retrieving a list of recipes"""
-        create_recipe(user=self.user)
-        create_recipe(user=self.user)
+        create_recipes(user=self.user, n=5)
+        tags = [Tag.objects.create(user=self.user, name=name)
+                for name in ('Vegan', 'Dinner')]
+        ingredients = [Ingredient.objects.create(user=self.user, name=name)
+                       for name in ('Rice', 'Dal')]
+        recipes = Recipe.objects.filter(user=self.user)
+        Recipe.tags.through.objects.bulk_create(
+            [Recipe.tags.through(recipe=recipe, tag=tag)
+             for recipe in recipes for tag in tags]
+        )
+        Recipe.ingredients.through.objects.bulk_create(
+            [Recipe.ingredients.through(recipe=recipe, ingredient=ingredient)
+             for recipe in recipes for ingredient in ingredients]
+        )
 
-        res = self.client.get(RECIPES_URL)
+        # One query for the recipes, one each for their tags and ingredients.
+        with self.assertNumQueries(3):
+            res = self.client.get(RECIPES_URL)
 
-        recipes = Recipe.objects.all().order_by('-id')
+        recipes = Recipe.objects.prefetch_related(
+            'tags', 'ingredients'
+        ).order_by('-id')
         serializer = RecipeSerializer(recipes, many=True)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data, serializer.data)
 
     def test_retrieve_list_recipe_limited_to_user(self):
         """Test for retrieving recipes related to the authenticated user"""
-        other_user = get_user_model().objects.create_user(
-            email='myemailtest@gmail.com',
-            password='ohmydemo123'
-        )
-
-        create_recipe(user=other_user)
+        create_recipe(user=self.other_user)
         create_recipe(user=self.user)
         res = self.client.get(RECIPES_URL)
         recipe = Recipe.objects.filter(user=self.user)
@@ -90,8 +123,7 @@ class PrivateRecipeApiTest(TestCase):
         recipe = create_recipe(self.user)
         url = get_detail_url(recipe.id)
         res = self.client.get(url)
-        recipe_data = Recipe.objects.get(id=recipe.id)
-        serialize = RecipeDetailSerializer(recipe_data)
+        serialize = RecipeDetailSerializer(recipe)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data, serialize.data)
 
@@ -149,14 +181,9 @@ class PrivateRecipeApiTest(TestCase):
 
     def test_changing_user_not_possible(self):
         """Test the changing user of recipe not possible."""
-        new_user = get_user_model().objects.create_user(
-            email='myemailtest@gmail.com',
-            password='ohmydemo123'
-        )
-
         recipe = create_recipe(user=self.user)
         payload = {
-            "user": new_user.id
+            "user": self.other_user.id
         }
 
         url = get_detail_url(recipe_id=recipe.id)
@@ -175,11 +202,7 @@ class PrivateRecipeApiTest(TestCase):
         self.assertFalse(Recipe.objects.filter(id=recipe.id).exists())
 
     def test_delete_other_user_recipe(self):
-        new_user = get_user_model().objects.create_user(
-            email='myemailtest@gmail.com',
-            password='ohmydemo123'
-        )
-        recipe = create_recipe(user=new_user)
+        recipe = create_recipe(user=self.other_user)
 
         url = get_detail_url(recipe_id=recipe.id)
         res = self.client.delete(url)
@@ -203,12 +226,12 @@ class PrivateRecipeApiTest(TestCase):
         self.assertEqual(recipes.count(), 1)
         recipe = recipes[0]
         self.assertEqual(recipe.tags.count(), 2)
-        for tag in payload['tags']:
-            exists = recipe.tags.filter(
-                name=tag['name'],
-                user=self.user
-            ).exists()
-            self.assertTrue(exists)
+        names = {tag['name'] for tag in payload['tags']}
+        matched = recipe.tags.filter(
+            user=self.user,
+            name__in=names
+        ).values_list('name', flat=True)
+        self.assertEqual(set(matched), names)
 
     def test_create_recipe_with_existing_tags(self):
         """Test creating recipe with existing tags."""
@@ -228,12 +251,12 @@ class PrivateRecipeApiTest(TestCase):
         recipe = recipes[0]
         self.assertEqual(recipe.tags.count(), 2)
         self.assertIn(tag_indian, recipe.tags.all())
-        for tag in payload["tags"]:
-            exists = recipe.tags.filter(
-                name=tag['name'],
-                user=self.user
-            ).exists()
-            self.assertTrue(exists)
+        names = {tag['name'] for tag in payload['tags']}
+        matched = recipe.tags.filter(
+            user=self.user,
+            name__in=names
+        ).values_list('name', flat=True)
+        self.assertEqual(set(matched), names)
 
     def test_create_tag_on_recipe_update(self):
         """Test creating tag when updating a recipe."""
@@ -303,12 +326,12 @@ class PrivateRecipeApiTest(TestCase):
         self.assertEqual(recipes.count(), 1)
         recipe = recipes[0]
         self.assertEqual(recipe.ingredients.count(), 2)
-        for ingredient in payload['ingredients']:
-            exists = recipe.ingredients.filter(
-                name=ingredient['name'],
-                user=self.user
-            ).exists()
-            self.assertTrue(exists)
+        names = {ingredient['name'] for ingredient in payload['ingredients']}
+        matched = recipe.ingredients.filter(
+            user=self.user,
+            name__in=names
+        ).values_list('name', flat=True)
+        self.assertEqual(set(matched), names)
 
     def test_create_recipe_with_existing_ingredient(self):
         """Test creating recipe with existing ingredient."""
@@ -331,12 +354,12 @@ class PrivateRecipeApiTest(TestCase):
         recipe = recipes[0]
         self.assertEqual(recipe.ingredients.count(), 2)
         self.assertIn(ingredient, recipe.ingredients.all())
-        for ingredient in payload['ingredients']:
-            exists = recipe.ingredients.filter(
-                name=ingredient['name'],
-                user=self.user
-            ).exists()
-            self.assertTrue(exists)
+        names = {ingredient['name'] for ingredient in payload['ingredients']}
+        matched = recipe.ingredients.filter(
+            user=self.user,
+            name__in=names
+        ).values_list('name', flat=True)
+        self.assertEqual(set(matched), names)
 
     def test_create_ingredients_on_update(self):
         """Test creating ingredients on update of recipe."""
@@ -395,24 +418,99 @@ class PrivateRecipeApiTest(TestCase):
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(recipe.ingredients.count(), 0)
 
+    def test_filter_by_tags(self):
+        """Test filtering recipes by tags."""
+        recipe1 = create_recipe(user=self.user, title='Thai vegetable curry')
+        recipe2 = create_recipe(user=self.user, title='Aubergine with tahini')
+        tag1 = Tag.objects.create(user=self.user, name='Vegan')
+        tag2 = Tag.objects.create(user=self.user, name='Vegetarian')
+        recipe1.tags.add(tag1)
+        recipe2.tags.add(tag2)
+        recipe3 = create_recipe(user=self.user, title='Fish and chips')
 
+        params = {'tags': f'{tag1.id},{tag2.id}'}
+        res = self.client.get(RECIPES_URL, params)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn(RecipeSerializer(recipe1).data, res.data)
+        self.assertIn(RecipeSerializer(recipe2).data, res.data)
+        self.assertNotIn(RecipeSerializer(recipe3).data, res.data)
+
+    def test_filter_by_ingredients(self):
+        """Test filtering recipes by ingredients."""
+        recipe1 = create_recipe(user=self.user, title='Posh beans on toast')
+        recipe2 = create_recipe(user=self.user, title='Chicken cacciatore')
+        ingredient1 = Ingredient.objects.create(user=self.user,
+                                                name='Feta cheese')
+        ingredient2 = Ingredient.objects.create(user=self.user,
+                                                name='Chicken')
+        recipe1.ingredients.add(ingredient1)
+        recipe2.ingredients.add(ingredient2)
+        recipe3 = create_recipe(user=self.user, title='Red lentil dal')
+
+        params = {'ingredients': f'{ingredient1.id},{ingredient2.id}'}
+        res = self.client.get(RECIPES_URL, params)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn(RecipeSerializer(recipe1).data, res.data)
+        self.assertIn(RecipeSerializer(recipe2).data, res.data)
+        self.assertNotIn(RecipeSerializer(recipe3).data, res.data)
+
+    def test_filter_recipe_matching_several_tags_listed_once(self):
+        """Test a recipe matching more than one filter tag is listed once."""
+        recipe = create_recipe(user=self.user)
+        tag1 = Tag.objects.create(user=self.user, name='Breakfast')
+        tag2 = Tag.objects.create(user=self.user, name='Quick')
+        recipe.tags.add(tag1, tag2)
+
+        params = {'tags': f'{tag1.id},{tag2.id}'}
+        res = self.client.get(RECIPES_URL, params)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 1)
+
+    def test_filter_with_invalid_ids_error(self):
+        """Test filtering with non numeric ids returns an error."""
+        res = self.client.get(RECIPES_URL, {'tags': 'vegan'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cached_token_skips_auth_query(self):
+        """Test a repeated token request authenticates from the cache."""
+        cache.clear()
+        token = Token.objects.create(user=self.user)
+        self.client.force_authenticate(user=None)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        self.client.get(RECIPES_URL)
+
+        with self.assertNumQueries(1):
+            res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+
+@pytest.mark.slow
 class PrivateRecipeApiTestForAdminUser(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-        admin_user = get_user_model().objects.create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the admin and normal users shared by every test."""
+        cls.admin_user = User.objects.create_user(
             email='admin@gmail.com',
             password='adminwe@123',
             is_superuser=True
         )
-        self.client.force_authenticate(user=admin_user)
-
-    def test_admin_user_view_all_recipe(self):
-        normal_user = get_user_model().objects.create_user(
+        cls.normal_user = User.objects.create_user(
             email='normal@gmail.com',
             password='adminwe@123'
         )
 
-        create_recipe(normal_user)
+    def setUp(self):
+        self.client.force_authenticate(user=self.admin_user)
+
+    def test_admin_user_view_all_recipe(self):
+        create_recipe(self.normal_user)
         recipes = Recipe.objects.all()
         serializer = RecipeSerializer(recipes, many=True)
 
@@ -422,13 +520,8 @@ class PrivateRecipeApiTestForAdminUser(TestCase):
         self.assertEqual(res.data, serializer.data)
 
     def test_admin_user_update_other_user_recipe(self):
-        normal_user = get_user_model().objects.create_user(
-            email='normal@gmail.com',
-            password='adminwe@123'
-        )
-
         link = "This is demo link"
-        recipe = create_recipe(user=normal_user, link=link)
+        recipe = create_recipe(user=self.normal_user, link=link)
 
         payload = {
             'description': 'Hello description is awesome'
@@ -443,11 +536,7 @@ class PrivateRecipeApiTestForAdminUser(TestCase):
         self.assertEqual(recipe.link, link)
 
     def test_deleting_recipe_of_other_user_as_admin_user(self):
-        normal_user = get_user_model().objects.create_user(
-            email='normal@gmail.com',
-            password='adminwe@123'
-        )
-        recipe = create_recipe(user=normal_user)
+        recipe = create_recipe(user=self.normal_user)
 
         url = get_detail_url(recipe_id=recipe.id)
         res = self.client.delete(url)
@@ -1,6 +1,6 @@
 """Tests for tag api"""
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from core.models import Tag
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -8,11 +8,12 @@ from django.urls import reverse
 from recipe.serializers import TagSerializer
 
 TAGS_URL = reverse('recipe:tag-list')
+TAG_DETAIL_PREFIX = reverse('recipe:tag-detail', args=[0]).rsplit('0/', 1)[0]
 
 
 def get_detail_tag_url(tag_id):
     """Create and return a tag detail url."""
-    return reverse('recipe:tag-detail', args=[tag_id])
+    return f'{TAG_DETAIL_PREFIX}{tag_id}/'
 
 
 def create_user(email='testmyuser@gmail.com', password='testmeiam@123'):
@@ -26,10 +27,19 @@ def create_tag(name, user):
     return Tag.objects.create(name=name, user=user)
 
 
-class PublicTagApiTest(TestCase):
+def create_tags(names, user):
+    """Create a tag for each name with a single query.
+
+    Nothing is returned: bulk_create() does not set primary keys on SQLite.
+    """
+    Tag.objects.bulk_create(
+        [Tag(name=name, user=user) for name in names]
+    )
+
+
+class PublicTagApiTest(SimpleTestCase):
     """Test for unauthenticated API requests."""
-    def setUp(self) -> None:
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_auth_required(self):
         res = self.client.get(TAGS_URL)
@@ -39,17 +49,22 @@ class PublicTagApiTest(TestCase):
 
 class PrivateTagApiTest(TestCase):
     """Test for authorized API requests."""
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the user shared by every test in the class."""
+        cls.user = create_user()
+
     def setUp(self) -> None:
-        self.user = create_user()
-        self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_tags(self):
         """Test for retrieve a list tags."""
-        create_tag(name='Vegan', user=self.user)
-        create_tag(name='Dessert', user=self.user)
+        create_tags(names=['Vegan', 'Dessert'], user=self.user)
 
-        res = self.client.get(TAGS_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(TAGS_URL)
 
         tags = Tag.objects.all().order_by('-name')
         serializer = TagSerializer(tags, many=True)
@@ -1,31 +1,79 @@
 """
 Views for the recipe APIs
 """
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (extend_schema,
+                                   extend_schema_view,
+                                   OpenApiParameter)
 from rest_framework import viewsets, mixins
-from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
+from core.authentication import CachedTokenAuthentication
 from core.models import (Recipe,
                          Tag,
                          Ingredient)
 from . import serializers
 
 
+@extend_schema_view(
+    list=extend_schema(
+        parameters=[
+            OpenApiParameter(
+                'tags',
+                OpenApiTypes.STR,
+                description='Comma separated list of tag IDs to filter.'
+            ),
+            OpenApiParameter(
+                'ingredients',
+                OpenApiTypes.STR,
+                description='Comma separated list of ingredient IDs to '
+                            'filter.'
+            )
+        ]
+    )
+)
 class RecipeViewSet(viewsets.ModelViewSet):
     serializer_class = serializers.RecipeDetailSerializer
+    action_serializer_classes = {
+        'list': serializers.RecipeSerializer
+    }
     queryset = Recipe.objects.all()
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
+    def _params_to_ints(self, name):
+        """Convert a comma separated query param to a list of integers."""
+        try:
+            return [int(str_id) for str_id in
+                    self.request.query_params[name].split(',')]
+        except ValueError:
+            raise ValidationError(
+                {name: 'Must be a comma separated list of IDs.'}
+            )
+
     def get_queryset(self):
         """Retrieve recipe for authenticated user"""
-        if self.request.user.is_superuser:
-            return self.queryset.order_by('-id')
-        return self.queryset.filter(user=self.request.user).order_by('-id')
+        queryset = self.queryset
+        if self.request.query_params.get('tags'):
+            queryset = queryset.filter(
+                tags__id__in=self._params_to_ints('tags')
+            ).distinct()
+        if self.request.query_params.get('ingredients'):
+            queryset = queryset.filter(
+                ingredients__id__in=self._params_to_ints('ingredients')
+            ).distinct()
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.prefetch_related('tags', 'ingredients')
+        if self.action == 'list':
+            queryset = queryset.defer('description')
+        user = self.request.user
+        if user.is_superuser:
+            return queryset.order_by('-id')
+        return queryset.filter(user=user).order_by('-id')
 
     def get_serializer_class(self):
-        if self.action == 'list':
-            return serializers.RecipeSerializer
-        return self.serializer_class
+        return self.action_serializer_classes.get(self.action,
+                                                  self.serializer_class)
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -36,7 +84,7 @@ class BaseRecipeAttrViewSet(mixins.ListModelMixin,
                             mixins.DestroyModelMixin,
                             viewsets.GenericViewSet):
     """Base class for Recipe attributes."""
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
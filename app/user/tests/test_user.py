@@ -20,9 +20,7 @@ def create_user(**kwargs):
 
 class PublicUserApiTests(TestCase):
     """Test the public features of user API"""
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_create_user_success(self):
         """Tests creating a user is successful"""
@@ -131,14 +129,18 @@ class PublicUserApiTests(TestCase):
 
 class PrivateUerApiTest(TestCase):
     """Test API requests that require authentication"""
+    client_class = APIClient
 
-    def setUp(self) -> None:
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create the user shared by every test in the class."""
+        cls.user = create_user(
             email='testuser@gmail.com',
             password='testpass',
             name='My Name test'
         )
-        self.client = APIClient()
+
+    def setUp(self) -> None:
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_profile_success(self):